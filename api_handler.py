@@ -5,13 +5,117 @@ Handles authentication and basic API communication with RunwayML.
 """
 
 import os
+import asyncio
 import requests
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the standard library
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for AsyncRunwayAPIHandler
+    httpx = None
+
+# Library module: leave logging configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# HTTP methods accepted by make_request
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "DELETE"})
+
+def _body_excerpt(content: bytes, limit: int = 512) -> str:
+    """
+    Decode the start of a response body for logging.
+    
+    Args:
+        content: Raw response body
+        limit: Maximum number of bytes to decode
+        
+    Returns:
+        Decoded text, with undecodable bytes replaced
+    """
+    return content[:limit].decode("utf-8", "replace")
+
+# Response statuses treated as transient and retried
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """
+    Return the given API key or fall back to the RUNWAYML_API_SECRET env var.
+    
+    Raises:
+        ValueError: If neither is set
+    """
+    api_key = api_key or os.environ.get("RUNWAYML_API_SECRET")
+    
+    if not api_key:
+        raise ValueError(
+            "No API key provided. Either pass api_key parameter or set RUNWAYML_API_SECRET environment variable."
+        )
+    return api_key
+
+def _build_headers(api_key: str) -> Dict[str, str]:
+    """
+    Build the authentication and content headers sent with every request.
+    """
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+def _default_retry() -> Retry:
+    """
+    Build the default retry policy for throttled and transient server errors.
+    
+    POST is left out of allowed_methods: a read timeout or 5xx after the server
+    has accepted an image-to-video job would otherwise resubmit it and create a
+    duplicate generation. POST is still retried on connection errors, where the
+    request never reached the server.
+    
+    Returns:
+        Retry honoring Retry-After with exponential backoff
+    """
+    return Retry(
+        total=5,
+        connect=3,
+        read=3,
+        status=3,
+        status_forcelist=sorted(_RETRY_STATUSES),
+        allowed_methods=_METHODS - {"POST"},
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+def _retry_after(response: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    Returns:
+        Delay in seconds, or None if the header is missing or not numeric
+    """
+    value = response.headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
 
 class RunwayAPIHandler:
     """
@@ -20,22 +124,52 @@ class RunwayAPIHandler:
     
     BASE_URL = "https://api.runwayml.com/v1"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, retry: Optional[Retry] = None):
         """
         Initialize the Runway API handler.
         
         Args:
             api_key: The Runway ML API key (optional, will use env var if not provided)
+            retry: urllib3 Retry policy for transient errors (optional, defaults to
+                retrying 429 and 5xx responses to non-POST requests with
+                exponential backoff)
         """
-        self.api_key = api_key or os.environ.get("RUNWAYML_API_SECRET")
+        self.api_key = _resolve_api_key(api_key)
         
-        if not self.api_key:
-            raise ValueError(
-                "No API key provided. Either pass api_key parameter or set RUNWAYML_API_SECRET environment variable."
-            )
+        # Headers never change for the lifetime of the handler, so build them once
+        self._headers = _build_headers(self.api_key)
+        
+        # Persistent session so connections (TCP + TLS) are reused across calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retry if retry is not None else _default_retry(),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self._headers)
+        
+        # Whether the API accepts multipart image uploads (None until probed)
+        self.multipart_supported: Optional[bool] = None
+        
+        # Switched to GET if the status endpoint rejects HEAD
+        self._status_check_method = "HEAD"
         
         logger.info("RunwayAPIHandler initialized")
         
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self.session.close()
+    
+    def __enter__(self) -> "RunwayAPIHandler":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
     def get_headers(self) -> Dict[str, str]:
         """
         Get the necessary headers for API requests.
@@ -43,69 +177,288 @@ class RunwayAPIHandler:
         Returns:
             Dict containing headers with authentication.
         """
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return self._headers
     
-    def make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        expected_error_statuses: FrozenSet[int] = frozenset()
+    ) -> Dict[str, Any]:
         """
         Make a request to the Runway ML API.
         
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (without base URL)
-            data: Request data/payload (for POST/PUT requests)
+            data: Query parameters (GET/HEAD/DELETE) or JSON payload (POST/PUT)
+            files: Files to upload as multipart/form-data (POST/PUT); data is
+                then sent as form fields instead of JSON
+            expected_error_statuses: Error statuses the caller handles itself (e.g. a
+                415 when probing for multipart support); these are still raised but
+                only logged at DEBUG level
             
         Returns:
-            Response data as dictionary
+            Response data as dictionary, or {"http_status": <status code>} for
+            HEAD requests and 204 No Content responses
             
         Raises:
             requests.exceptions.RequestException: If request fails
         """
         url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-        headers = self.get_headers()
+        method = method.upper()
         
         try:
-            logger.info(f"Making {method} request to {endpoint}")
-            
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=data)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=headers, json=data)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers, json=data)
-            else:
+            logger.info("Making %s request to %s", method, endpoint)
+            
+            if method not in _METHODS:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            # GET, HEAD and DELETE carry data as query params, POST and PUT as a JSON body
+            # The JSON body is serialized here (Content-Type is set on the session)
+            if method in ("GET", "HEAD", "DELETE"):
+                kwargs = {"params": data}
+            elif files is not None:
+                # Drop the session's JSON Content-Type so requests sets the multipart boundary
+                kwargs = {"data": data, "files": files, "headers": {"Content-Type": None}}
+            else:
+                kwargs = {"data": _json_dumps(data) if data is not None else None}
+            response = self.session.request(method, url, timeout=(5, 60), **kwargs)
+            
             response.raise_for_status()
-            return response.json()
+            # Bodiless by definition; other empty bodies still fail JSON parsing.
+            # "http_status" cannot collide with the "status" field of task responses.
+            if method == "HEAD" or response.status_code == 204:
+                return {"http_status": response.status_code}
+            return self._parse(response)
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {str(e)}")
+            response = getattr(e, 'response', None)
+            if response is not None and response.status_code in expected_error_statuses:
+                logger.debug("API request returned expected status %s", response.status_code)
+                raise
+            
+            logger.error("API request failed: %s", e)
             
             # Try to get more details if available
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response status: {e.response.status_code}")
-                logger.error(f"Response body: {e.response.text}")
+                logger.error("Response status: %s", e.response.status_code)
+                logger.error("Response body: %s", _body_excerpt(e.response.content))
                 
             raise
     
+    def _parse(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Parse a JSON response body.
+        
+        The encoding is set up front so requests never runs charset detection.
+        
+        Args:
+            response: Response from the API
+            
+        Returns:
+            Response data as dictionary
+            
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON
+        """
+        response.encoding = "utf-8"
+        try:
+            return _json_loads(response.content)
+        except ValueError as e:
+            # orjson and json decode errors are ValueErrors; surface them as a
+            # RequestException like response.json() does
+            raise requests.exceptions.JSONDecodeError(
+                getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0),
+                response=response,
+            ) from e
+    
     def check_api_status(self) -> bool:
         """
         Check if the API is accessible and the key is valid.
         
+        Sends HEAD to avoid transferring the body. If the endpoint rejects HEAD
+        with 405, the check falls back to GET for the lifetime of the handler.
+        
         Returns:
             True if API is accessible, False otherwise
         """
         try:
             # This endpoint is based on common patterns, may need adjustment
-            response = self.make_request("GET", "/organization")
+            try:
+                self.make_request(self._status_check_method, "/organization")
+            except requests.exceptions.HTTPError as e:
+                if self._status_check_method != "HEAD" or e.response is None or e.response.status_code != 405:
+                    raise
+                logger.info("HEAD not allowed for status check, falling back to GET")
+                self._status_check_method = "GET"
+                self.make_request("GET", "/organization")
+            # make_request raises on non-2xx responses, so reaching here means healthy
             return True
         except Exception as e:
-            logger.warning(f"API status check failed: {str(e)}")
+            logger.warning("API status check failed: %s", e)
             return False
 
+
+class AsyncRunwayAPIHandler:
+    """
+    Asynchronous handler for Runway ML API interactions.
+    
+    Uses a single httpx.AsyncClient with HTTP/2 so many concurrent requests
+    (e.g. polling several tasks) are multiplexed over one connection.
+    Requires the optional ``httpx[http2]`` dependency.
+    """
+    
+    BASE_URL = RunwayAPIHandler.BASE_URL
+    
+    def __init__(self, api_key: Optional[str] = None, max_retries: int = 3, backoff_factor: float = 0.5):
+        """
+        Initialize the async Runway API handler.
+        
+        Args:
+            api_key: The Runway ML API key (optional, will use env var if not provided)
+            max_retries: Retries for connection errors and for 429/5xx responses
+                to non-POST requests, matching the sync handler's default policy
+            backoff_factor: Base delay for exponential backoff between retries (seconds)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncRunwayAPIHandler requires httpx. Install it with: pip install 'httpx[http2]'"
+            )
+        
+        self.api_key = _resolve_api_key(api_key)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._headers = _build_headers(self.api_key)
+        
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self._headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        
+        # Switched to GET if the status endpoint rejects HEAD
+        self._status_check_method = "HEAD"
+        
+        logger.info("AsyncRunwayAPIHandler initialized")
+    
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its connections.
+        """
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> "AsyncRunwayAPIHandler":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Runway ML API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (without base URL)
+            data: Query parameters (GET/HEAD/DELETE) or JSON payload (POST/PUT)
+            
+        Returns:
+            Response data as dictionary, or {"http_status": <status code>} for
+            HEAD requests and 204 No Content responses
+            
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        url = f"/{endpoint.lstrip('/')}"
+        method = method.upper()
+        
+        try:
+            logger.info("Making %s request to %s", method, endpoint)
+            
+            if method not in _METHODS:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            if method in ("GET", "HEAD", "DELETE"):
+                kwargs = {"params": data}
+            else:
+                kwargs = {"content": _json_dumps(data) if data is not None else None}
+            response = await self._request_with_retries(method, url, **kwargs)
+            
+            response.raise_for_status()
+            # Bodiless by definition; other empty bodies still fail JSON parsing.
+            # "http_status" cannot collide with the "status" field of task responses.
+            if method == "HEAD" or response.status_code == 204:
+                return {"http_status": response.status_code}
+            return _json_loads(response.content)
+            
+        except httpx.HTTPError as e:
+            logger.error("API request failed: %s", e)
+            
+            # Try to get more details if available
+            if isinstance(e, httpx.HTTPStatusError):
+                logger.error("Response status: %s", e.response.status_code)
+                logger.error("Response body: %s", _body_excerpt(e.response.content))
+                
+            raise
+    
+    async def _request_with_retries(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a request, retrying transient failures with exponential backoff.
+        
+        Connection errors are retried for every method since the request never
+        reached the server. 429/5xx responses are retried except for POST, so an
+        accepted image-to-video job is never resubmitted. Retry-After is honored.
+        
+        Returns:
+            The final response (which may still carry an error status)
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_factor * (2 ** attempt)
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or method == "POST"
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                delay = _retry_after(response) or self.backoff_factor * (2 ** attempt)
+            
+            attempt += 1
+            logger.info("Retrying %s %s in %.1fs (attempt %d)", method, url, delay, attempt)
+            await asyncio.sleep(delay)
+    
+    async def check_api_status(self) -> bool:
+        """
+        Check if the API is accessible and the key is valid.
+        
+        Sends HEAD to avoid transferring the body. If the endpoint rejects HEAD
+        with 405, the check falls back to GET for the lifetime of the handler.
+        
+        Returns:
+            True if API is accessible, False otherwise
+        """
+        try:
+            try:
+                await self.make_request(self._status_check_method, "/organization")
+            except httpx.HTTPStatusError as e:
+                if self._status_check_method != "HEAD" or e.response.status_code != 405:
+                    raise
+                logger.info("HEAD not allowed for status check, falling back to GET")
+                self._status_check_method = "GET"
+                await self.make_request("GET", "/organization")
+            # make_request raises on non-2xx responses, so reaching here means healthy
+            return True
+        except Exception as e:
+            logger.warning("API status check failed: %s", e)
+            return False
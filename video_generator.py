@@ -5,86 +5,356 @@ Handles video generation using Runway ML API.
 """
 
 import os
-import base64
+import asyncio
+import copy
+import functools
+import io
 import json
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, Tuple, Union
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 
-from .api_handler import RunwayAPIHandler
+from .api_handler import AsyncRunwayAPIHandler, RunwayAPIHandler
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import pybase64 as _b64  # SIMD-accelerated drop-in for base64
+except ImportError:
+    import base64 as _b64
+
+# Library module: leave logging configuration to the application
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# MIME types for supported image extensions
+_MIME_BY_SUFFIX = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+
+# Parameter values accepted by the image-to-video endpoint
+_VALID_DURATIONS = frozenset({5, 10})
+_VALID_RATIOS = frozenset({"1280:720", "720:1280", "1104:832", "832:1104", "960:960", "1584:672"})
+
+# Task statuses after which a task will not change again
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "canceled"})
+
+# Read size for streaming base64 encoding (multiple of 3)
+_ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Larger files are encoded without memoization so the cache stays small
+# (at most 8 entries of ~1.33x this size)
+_ENCODE_CACHE_MAX_SIZE = 2 * 1024 * 1024
+
+def _sniff_mime_type(header: bytes) -> Optional[str]:
+    """
+    Detect an image MIME type from the first 12 bytes of a file.
+    
+    Args:
+        header: Leading bytes of the file
+        
+    Returns:
+        MIME type string, or None if the signature is not recognized
+    """
+    if header.startswith(b"\x89PNG"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+def _image_mime_type(image_path: Path) -> str:
+    """
+    Resolve the MIME type of an image file from its extension.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        MIME type string
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the extension is not a supported image format
+    """
+    if not image_path.exists():
+        raise FileNotFoundError(f"Image file not found: {image_path}")
+        
+    mime_type = _MIME_BY_SUFFIX.get(image_path.suffix.lower())
+    if mime_type is None:
+        raise ValueError(f"Unsupported image format: {image_path.suffix}. Use JPG, PNG or WEBP.")
+    return mime_type
+
+def _check_image_signature(image_file: IO[bytes], image_path: Path, mime_type: str) -> None:
+    """
+    Verify that an open image file's signature matches its extension.
+    
+    The file position is reset to the start afterwards.
+    
+    Raises:
+        ValueError: If the contents do not match the expected format
+    """
+    detected = _sniff_mime_type(image_file.read(12))
+    if detected != mime_type:
+        raise ValueError(
+            f"Image format mismatch: {image_path} has extension {image_path.suffix} "
+            f"but contents look like {detected or 'an unknown format'}"
+        )
+    image_file.seek(0)
+
+def _encode_file(path_str: str, mime_type: str) -> str:
+    """
+    Encode an image file as a base64 data URI.
+    
+    Args:
+        path_str: Path to the image file
+        mime_type: MIME type for the data URI
+        
+    Returns:
+        Base64 encoded string with data URI prefix
+    """
+    image_path = Path(path_str)
+    
+    with open(image_path, "rb") as image_file:
+        # Check the file signature so a mislabeled image fails before upload
+        _check_image_signature(image_file, image_path, mime_type)
+        return _encode_stream(image_file, mime_type)
+
+@functools.lru_cache(maxsize=8)
+def _encode_file_cached(path_str: str, mime_type: str, mtime_ns: int, size: int) -> str:
+    """
+    Encode an image file as a base64 data URI, memoized per file version.
+    
+    mtime_ns and size are only part of the cache key. Only files up to
+    _ENCODE_CACHE_MAX_SIZE go through this cache.
+    
+    Args:
+        path_str: Absolute path to the image file
+        mime_type: MIME type for the data URI
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Base64 encoded string with data URI prefix
+    """
+    return _encode_file(path_str, mime_type)
+
+def _encode_stream(image_file: IO[bytes], mime_type: str, head: bytes = b"") -> str:
+    """
+    Encode a binary stream as a base64 data URI.
+    
+    Reads may return fewer bytes than requested (raw or unbuffered streams), so
+    bytes left over after the last multiple of 3 are carried into the next chunk.
+    
+    Args:
+        image_file: Binary file object positioned after head
+        mime_type: MIME type for the data URI
+        head: Bytes already read from the start of the stream
+        
+    Returns:
+        Base64 encoded string with data URI prefix
+    """
+    # Encode in chunks straight into the data URI buffer to keep peak memory low.
+    # Only whole 3-byte groups are encoded mid-stream so no padding is emitted.
+    buf = bytearray(b"data:" + mime_type.encode() + b";base64,")
+    carry = bytes(head)
+    while True:
+        chunk = image_file.read(_ENCODE_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = carry + chunk if carry else chunk
+        cut = len(data) - len(data) % 3
+        buf.extend(_b64.b64encode(data[:cut]))
+        carry = data[cut:]
+    buf.extend(_b64.b64encode(carry))
+        
+    return buf.decode("ascii")
+
+def _read_head(image_file: IO[bytes], size: int = 12) -> bytes:
+    """
+    Read the first bytes of a binary file object, tolerating short reads.
+    
+    Args:
+        image_file: Binary file object
+        size: Number of bytes to read
+        
+    Returns:
+        Up to size bytes (fewer only at end of stream)
+        
+    Raises:
+        TypeError: If the file object is opened in text mode
+    """
+    head = b""
+    while len(head) < size:
+        chunk = image_file.read(size - len(head))
+        if not chunk:
+            break
+        if not isinstance(chunk, (bytes, bytearray)):
+            raise TypeError("Image file objects must be opened in binary mode ('rb')")
+        head += chunk
+    return head
+
+def _in_memory_mime_type(header: bytes, mime_type: Optional[str]) -> str:
+    """
+    Resolve the MIME type of in-memory image data from its signature.
+    
+    Args:
+        header: Leading bytes of the image
+        mime_type: Expected MIME type (optional, detected if not provided; used as
+            given when the signature is not recognized)
+        
+    Returns:
+        MIME type string
+        
+    Raises:
+        ValueError: If the format is unsupported, undetectable without mime_type,
+            or detected as a different format than mime_type
+    """
+    detected = _sniff_mime_type(header)
+    if mime_type is None:
+        if detected is None:
+            raise ValueError(
+                "Could not detect image format: data is not a recognized JPG, PNG or WEBP image. "
+                "Pass mime_type explicitly to override."
+            )
+        return detected
+    
+    if mime_type not in _MIME_BY_SUFFIX.values():
+        raise ValueError(f"Unsupported image format: {mime_type}. Use JPG, PNG or WEBP.")
+    # An explicit mime_type is trusted when the signature is not recognized,
+    # but a recognized signature must agree with it
+    if detected is not None and detected != mime_type:
+        raise ValueError(
+            f"Image format mismatch: expected {mime_type} "
+            f"but contents look like {detected or 'an unknown format'}"
+        )
+    return mime_type
 
 class RunwayVideoGenerator:
     """
     Generator for creating videos using Runway ML API.
     """
     
-    def __init__(self, api_handler: Optional[RunwayAPIHandler] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_handler: Optional[RunwayAPIHandler] = None,
+        api_key: Optional[str] = None,
+        status_cache_ttl: float = 1.0,
+        async_api_handler: Optional[AsyncRunwayAPIHandler] = None
+    ):
         """
         Initialize the video generator.
         
         Args:
             api_handler: Existing RunwayAPIHandler instance (optional)
             api_key: The Runway ML API key (optional, used only if api_handler not provided)
+            status_cache_ttl: How long a fetched task status is reused by direct
+                get_task_status calls (seconds, 0 disables)
+            async_api_handler: Existing AsyncRunwayAPIHandler for the async methods
+                (optional, created on first use if not provided; a created handler
+                is bound to the running event loop and must be released with aclose())
         """
         self.api_handler = api_handler or RunwayAPIHandler(api_key)
+        self.async_api_handler = async_api_handler
+        
+        # Only an async handler created here is closed by aclose()
+        self._owns_async_handler = False
+        self.status_cache_ttl = status_cache_ttl
+        
+        # task_id -> (fetch time, status data), holding only entries younger than the TTL
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._status_cache_lock = threading.Lock()
         logger.info("RunwayVideoGenerator initialized")
     
-    def encode_image_to_base64(self, image_path: Union[str, Path]) -> str:
+    async def aclose(self) -> None:
+        """
+        Close the async API handler if this generator created it.
+        
+        The handler is dropped so a later async call (e.g. under a new event
+        loop) creates a fresh one instead of reusing connections from a closed loop.
+        """
+        if self._owns_async_handler and self.async_api_handler is not None:
+            await self.async_api_handler.aclose()
+            self.async_api_handler = None
+            self._owns_async_handler = False
+    
+    async def __aenter__(self) -> "RunwayVideoGenerator":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    def encode_image_to_base64(
+        self,
+        image_path: Union[str, Path, bytes, IO[bytes]],
+        mime_type: Optional[str] = None
+    ) -> str:
         """
         Encode an image to base64 string.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, the image bytes, or a binary file object
+            mime_type: MIME type of in-memory bytes or file objects (optional, detected
+                from the image signature if not provided; ignored for paths, which
+                use the file extension)
             
         Returns:
             Base64 encoded string with data URI prefix
         """
+        if isinstance(image_path, (bytes, bytearray, memoryview)):
+            mime_type = _in_memory_mime_type(bytes(image_path[:12]), mime_type)
+            return f"data:{mime_type};base64,{_b64.b64encode(image_path).decode('ascii')}"
+        
+        if hasattr(image_path, "read"):
+            if isinstance(image_path, io.TextIOBase):
+                raise TypeError("Image file objects must be opened in binary mode ('rb')")
+            head = _read_head(image_path)
+            mime_type = _in_memory_mime_type(head, mime_type)
+            return _encode_stream(image_path, mime_type, head)
+        
         image_path = Path(image_path)
+        mime_type = _image_mime_type(image_path)
         
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
-            
-        with open(image_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-            
-        # Determine image format from extension
-        img_format = image_path.suffix.lower().lstrip('.')
-        if img_format in ('jpg', 'jpeg'):
-            mime_type = 'image/jpeg'
-        elif img_format == 'png':
-            mime_type = 'image/png'
-        else:
-            raise ValueError(f"Unsupported image format: {img_format}. Use JPG or PNG.")
-            
-        # Format as data URI
-        return f"data:{mime_type};base64,{encoded_string}"
+        # Key the cache on the absolute path (relative paths depend on the working
+        # directory) plus mtime and size so an edited file is re-encoded
+        resolved = str(image_path.resolve())
+        stat = image_path.stat()
+        if stat.st_size > _ENCODE_CACHE_MAX_SIZE:
+            return _encode_file(resolved, mime_type)
+        return _encode_file_cached(resolved, mime_type, stat.st_mtime_ns, stat.st_size)
     
     def create_video_from_image(
         self,
-        image_path: Union[str, Path],
+        image_path: Union[str, Path, bytes, IO[bytes]],
         prompt_text: str,
         duration: int = 5,
         ratio: str = "1280:720",
         model: str = "gen4_turbo",
         seed: Optional[int] = None,
         watermark: bool = False,
+        use_multipart: bool = False,
     ) -> Dict[str, Any]:
         """
         Create a video from an image using Runway ML API.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, the image bytes, or a binary file object
             prompt_text: Text prompt describing the desired motion
             duration: Video duration in seconds (5 or 10)
             ratio: Aspect ratio (e.g., "1280:720", "720:1280", etc.)
             model: Model to use (default: "gen4_turbo")
             seed: Optional seed for reproducibility
             watermark: Whether to include the Runway watermark
+            use_multipart: Upload the raw image as multipart/form-data instead of
+                a base64 data URI. Falls back to the data URI if the API rejects
+                it with 415, and remembers that on the API handler. Only used
+                when image_path is a path.
             
         Returns:
             Response data containing task ID
@@ -94,20 +364,15 @@ class RunwayVideoGenerator:
             requests.exceptions.RequestException: If API request fails
         """
         # Validate parameters
-        if duration not in (5, 10):
+        if duration not in _VALID_DURATIONS:
             raise ValueError("Duration must be either 5 or 10 seconds")
             
-        valid_ratios = ["1280:720", "720:1280", "1104:832", "832:1104", "960:960", "1584:672"]
-        if ratio not in valid_ratios:
-            raise ValueError(f"Invalid ratio. Must be one of: {', '.join(valid_ratios)}")
-        
-        # Encode the image to base64
-        encoded_image = self.encode_image_to_base64(image_path)
+        if ratio not in _VALID_RATIOS:
+            raise ValueError(f"Invalid ratio. Must be one of: {', '.join(sorted(_VALID_RATIOS))}")
         
         # Prepare the payload
         payload = {
             "model": model,
-            "prompt_image": encoded_image,
             "prompt_text": prompt_text,
             "duration": duration,
             "ratio": ratio,
@@ -118,61 +383,353 @@ class RunwayVideoGenerator:
         if seed is not None:
             payload["seed"] = seed
         
-        # Create the video generation task
-        logger.info(f"Creating video with {model} model, {duration}s duration, {ratio} ratio")
-        response = self.api_handler.make_request("POST", "/image-to-video", payload)
+        logger.info("Creating video with %s model, %ss duration, %s ratio", model, duration, ratio)
         
-        logger.info(f"Video generation task created: {response.get('id', 'Unknown ID')}")
+        response = None
+        is_path = isinstance(image_path, (str, Path))
+        if use_multipart and is_path and self.api_handler.multipart_supported is not False:
+            try:
+                response = self._create_video_multipart(Path(image_path), payload)
+                self.api_handler.multipart_supported = True
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 415:
+                    raise
+                logger.info("Multipart upload not supported, falling back to base64 data URI")
+                self.api_handler.multipart_supported = False
+        
+        if response is None:
+            # Encode the image to base64
+            payload["prompt_image"] = self.encode_image_to_base64(image_path)
+            
+            # Create the video generation task
+            response = self.api_handler.make_request("POST", "/image-to-video", payload)
+        
+        logger.info("Video generation task created: %s", response.get('id', 'Unknown ID'))
         return response
     
-    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+    def _create_video_multipart(self, image_path: Path, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create the video generation task by uploading the raw image bytes.
+        
+        Args:
+            image_path: Path to the image file
+            payload: Request fields other than the image
+            
+        Returns:
+            Response data containing task ID
+        """
+        mime_type = _image_mime_type(image_path)
+        
+        # Form fields are sent as strings
+        form = {
+            key: str(value).lower() if isinstance(value, bool) else str(value)
+            for key, value in payload.items()
+        }
+        
+        with open(image_path, "rb") as image_file:
+            _check_image_signature(image_file, image_path, mime_type)
+            files = {"prompt_image": (image_path.name, image_file, mime_type)}
+            # A 415 is the expected "not supported" answer, handled by the caller
+            return self.api_handler.make_request(
+                "POST", "/image-to-video", form, files=files, expected_error_statuses=frozenset({415})
+            )
+    
+    def get_task_status(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get the status of a video generation task.
         
         Args:
             task_id: The task ID returned from create_video_from_image
+            use_cache: Return a status fetched within status_cache_ttl if available.
+                The polling loops pass False so their backoff is not masked by the
+                cache; the fresh result still refreshes it.
+            
+        Returns:
+            Status data
+        """
+        if use_cache:
+            cached = self._get_cached_status(task_id)
+            if cached is not None:
+                return cached
+        
+        status_data = self.api_handler.make_request("GET", f"/tasks/{task_id}")
+        self._store_status(task_id, status_data)
+        return status_data
+    
+    async def get_task_status_async(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Get the status of a video generation task without blocking.
+        
+        Args:
+            task_id: The task ID returned from create_video_from_image
+            use_cache: Return a status fetched within status_cache_ttl if available
             
         Returns:
             Status data
         """
-        return self.api_handler.make_request("GET", f"/tasks/{task_id}")
+        if use_cache:
+            cached = self._get_cached_status(task_id)
+            if cached is not None:
+                return cached
+        
+        if self.async_api_handler is None:
+            self.async_api_handler = AsyncRunwayAPIHandler(self.api_handler.api_key)
+            self._owns_async_handler = True
+        
+        status_data = await self.async_api_handler.make_request("GET", f"/tasks/{task_id}")
+        self._store_status(task_id, status_data)
+        return status_data
+    
+    def _get_cached_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached status for a task if it is younger than the TTL.
+        """
+        with self._status_cache_lock:
+            cached = self._status_cache.get(task_id)
+        if cached is not None and time.monotonic() - cached[0] < self.status_cache_ttl:
+            return copy.deepcopy(cached[1])
+        return None
+    
+    def _store_status(self, task_id: str, status_data: Dict[str, Any]) -> None:
+        """
+        Cache a freshly fetched status, dropping the entry once the task is finished.
+        
+        Expired entries are pruned on every store, so tasks that are abandoned,
+        time out or error out do not stay cached for the generator's lifetime.
+        """
+        if self.status_cache_ttl <= 0:
+            return
+        
+        now = time.monotonic()
+        with self._status_cache_lock:
+            expired = [
+                key for key, (fetched_at, _) in self._status_cache.items()
+                if now - fetched_at >= self.status_cache_ttl
+            ]
+            for key in expired:
+                del self._status_cache[key]
+            
+            if status_data.get("status") in _TERMINAL_STATUSES:
+                self._status_cache.pop(task_id, None)
+            else:
+                # Store a copy so callers mutating their result do not alter the cache
+                self._status_cache[task_id] = (now, copy.deepcopy(status_data))
+    
+    def _check_status(self, task_id: str, status_data: Dict[str, Any]) -> Optional[Tuple[bool, Dict[str, Any]]]:
+        """
+        Log a polled task status and map terminal statuses to a result.
+        
+        Args:
+            task_id: The task ID
+            status_data: Status data from get_task_status
+            
+        Returns:
+            (success, status_data) if the task has finished, None if it is still processing
+        """
+        status = status_data.get("status")
+        logger.info("Task %s: Status = %s", task_id, status)
+        
+        if status == "completed":
+            logger.info("Task %s completed successfully", task_id)
+            return True, status_data
+        elif status in ("failed", "canceled"):
+            logger.error("Task %s %s: %s", task_id, status, status_data.get('error', 'Unknown error'))
+            return False, status_data
+        return None
     
     def wait_for_completion(
         self, 
         task_id: str, 
         polling_interval: float = 5.0,
-        timeout: float = 300.0
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: Optional[float] = None
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Wait for a task to complete.
         
+        Polls with exponential backoff, starting at initial_interval and growing
+        by 1.5x per check up to max_interval.
+        
         Args:
             task_id: The task ID
-            polling_interval: How often to check status (seconds)
+            polling_interval: Default upper bound on the polling interval (seconds)
             timeout: Maximum time to wait (seconds)
+            initial_interval: Delay before the second status check (seconds)
+            max_interval: Maximum delay between checks (defaults to polling_interval)
             
         Returns:
             Tuple of (success, response_data)
         """
-        start_time = time.time()
+        if max_interval is None:
+            max_interval = polling_interval
+        
+        interval = initial_interval
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
-            status_data = self.get_task_status(task_id)
+        while time.monotonic() < deadline:
+            status_data = self.get_task_status(task_id, use_cache=False)
             
-            status = status_data.get("status")
-            logger.info(f"Task {task_id}: Status = {status}")
+            result = self._check_status(task_id, status_data)
+            if result is not None:
+                return result
             
-            if status == "completed":
-                logger.info(f"Task {task_id} completed successfully")
-                return True, status_data
-            elif status in ("failed", "canceled"):
-                logger.error(f"Task {task_id} {status}: {status_data.get('error', 'Unknown error')}")
-                return False, status_data
+            # Still processing, wait and check again
+            # Never sleep past the deadline
+            delay = min(interval, max_interval, max(deadline - time.monotonic(), 0))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task still processing. Waiting %ss before next check.", delay)
+            time.sleep(delay)
+            interval = min(interval * 1.5, max_interval)
+        
+        # If we get here, we timed out
+        logger.warning("Timeout waiting for task %s to complete", task_id)
+        return False, {"status": "timeout"}
+    
+    def wait_for_many(
+        self,
+        task_ids: List[str],
+        polling_interval: float = 5.0,
+        timeout: float = 300.0,
+        max_workers: int = 8
+    ) -> Dict[str, Tuple[bool, Dict[str, Any]]]:
+        """
+        Wait for several tasks to complete, polling their status concurrently.
+        
+        Each polling tick checks every still-pending task in parallel over the
+        handler's shared session, so detection time does not grow with the
+        number of tasks.
+        
+        Args:
+            task_ids: The task IDs to wait for
+            polling_interval: How often to check status (seconds)
+            timeout: Maximum time to wait for all tasks (seconds)
+            max_workers: Maximum number of concurrent status requests
+            
+        Returns:
+            Dictionary mapping each task ID to a (success, response_data) tuple.
+            A task whose status check raises is reported as
+            (False, {"status": "error", "error": <message>}).
+        """
+        results: Dict[str, Tuple[bool, Dict[str, Any]]] = {}
+        pending = list(dict.fromkeys(task_ids))
+        deadline = time.monotonic() + timeout
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending and time.monotonic() < deadline:
+                futures = {
+                    executor.submit(self.get_task_status, task_id, use_cache=False): task_id
+                    for task_id in pending
+                }
+                
+                for future in as_completed(futures):
+                    task_id = futures[future]
+                    try:
+                        status_data = future.result()
+                    except Exception as e:
+                        # Record the failure so one bad task does not discard the others
+                        logger.error("Status check for task %s failed: %s", task_id, e)
+                        results[task_id] = (False, {"status": "error", "error": str(e)})
+                        continue
+                    
+                    result = self._check_status(task_id, status_data)
+                    if result is not None:
+                        results[task_id] = result
+                
+                pending = [task_id for task_id in pending if task_id not in results]
+                
+                if pending:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "%d tasks still processing. Waiting %ss before next check.",
+                            len(pending), polling_interval
+                        )
+                    time.sleep(min(polling_interval, max(deadline - time.monotonic(), 0)))
+        
+        # Anything left over timed out
+        for task_id in pending:
+            logger.warning("Timeout waiting for task %s to complete", task_id)
+            results[task_id] = (False, {"status": "timeout"})
+        
+        return results
+    
+    async def wait_for_completion_async(
+        self, 
+        task_id: str, 
+        polling_interval: float = 5.0,
+        timeout: float = 300.0,
+        initial_interval: float = 0.5,
+        max_interval: Optional[float] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Wait for a task to complete without blocking the event loop.
+        
+        Same backoff behaviour as wait_for_completion, using the async API handler.
+        
+        Args:
+            task_id: The task ID
+            polling_interval: Default upper bound on the polling interval (seconds)
+            timeout: Maximum time to wait (seconds)
+            initial_interval: Delay before the second status check (seconds)
+            max_interval: Maximum delay between checks (defaults to polling_interval)
+            
+        Returns:
+            Tuple of (success, response_data)
+        """
+        if max_interval is None:
+            max_interval = polling_interval
+        
+        interval = initial_interval
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            status_data = await self.get_task_status_async(task_id, use_cache=False)
+            
+            result = self._check_status(task_id, status_data)
+            if result is not None:
+                return result
             
             # Still processing, wait and check again
-            logger.debug(f"Task still processing. Waiting {polling_interval}s before next check.")
-            time.sleep(polling_interval)
+            # Never sleep past the deadline
+            delay = min(interval, max_interval, max(deadline - time.monotonic(), 0))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task still processing. Waiting %ss before next check.", delay)
+            await asyncio.sleep(delay)
+            interval = min(interval * 1.5, max_interval)
         
         # If we get here, we timed out
-        logger.warning(f"Timeout waiting for task {task_id} to complete")
+        logger.warning("Timeout waiting for task %s to complete", task_id)
         return False, {"status": "timeout"}
+    
+    async def wait_for_many_async(
+        self,
+        task_ids: List[str],
+        polling_interval: float = 5.0,
+        timeout: float = 300.0
+    ) -> Dict[str, Tuple[bool, Dict[str, Any]]]:
+        """
+        Wait for several tasks to complete, multiplexing their polls over one connection.
+        
+        Args:
+            task_ids: The task IDs to wait for
+            polling_interval: Upper bound on the polling interval (seconds)
+            timeout: Maximum time to wait for each task (seconds)
+            
+        Returns:
+            Dictionary mapping each task ID to a (success, response_data) tuple.
+            A task whose status check raises is reported as
+            (False, {"status": "error", "error": <message>}).
+        """
+        async def wait_one(task_id: str) -> Tuple[bool, Dict[str, Any]]:
+            try:
+                return await self.wait_for_completion_async(
+                    task_id, polling_interval=polling_interval, timeout=timeout
+                )
+            except Exception as e:
+                # Record the failure so one bad task does not discard the others
+                logger.error("Status check for task %s failed: %s", task_id, e)
+                return False, {"status": "error", "error": str(e)}
+        
+        unique_ids = list(dict.fromkeys(task_ids))
+        results = await asyncio.gather(*(wait_one(task_id) for task_id in unique_ids))
+        return dict(zip(unique_ids, results))